@@ -0,0 +1,88 @@
+import datetime
+import os
+import random
+import tempfile
+import time
+
+from price_history import PriceHistory
+
+
+PRODUCTS = 100_000
+FILES = 5
+DAYS = 365
+CHANGED = 0.02
+REMOVED = 0.001
+
+
+def make_catalog():
+    rnd = random.Random(0)
+    return {
+        (f'товар {number}', f'price_{number % FILES}.csv'): (rnd.randint(50, 5000), rnd.randint(1, 10))
+        for number in range(PRODUCTS)
+    }
+
+
+def rows(catalog):
+    # строки в формате PriceMachine.data
+    return [
+        (round(price / weight, 2), name, price, weight, file_name)
+        for (name, file_name), (price, weight) in catalog.items()
+    ]
+
+
+def timed(operation, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = operation()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    rnd = random.Random(1)
+    catalog = make_catalog()
+    keys = list(catalog)
+    history = PriceHistory()
+    first_day = datetime.date(2024, 1, 1)
+
+    csv_size = 0
+    record_time = 0
+    for day in range(DAYS):
+        for key in rnd.sample(keys, int(PRODUCTS * CHANGED)):
+            price, weight = catalog.get(key, (100, 1))
+            catalog[key] = (max(price + rnd.randint(-price // 5, price // 5), 1), weight)
+        for key in rnd.sample(keys, int(PRODUCTS * REMOVED)):
+            catalog.pop(key, None)
+        data = rows(catalog)
+        csv_size += sum(len(f'{name},{price},{weight}\n'.encode('utf-8')) for _, name, price, weight, _ in data)
+        start = time.perf_counter()
+        history.record(data, first_day + datetime.timedelta(days=day))
+        record_time += time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        fname = os.path.join(directory, 'history.bin')
+        start = time.perf_counter()
+        size = history.save(fname)
+        save_time = time.perf_counter() - start
+        start = time.perf_counter()
+        PriceHistory.load(fname)
+        load_time = time.perf_counter() - start
+
+    print(f'{PRODUCTS} товаров, {DAYS} ежедневных загрузок, меняется {CHANGED:.0%} цен в день')
+    print(f'Полные CSV за год:             {csv_size / 2 ** 20:8.1f} МБ')
+    print(f'Файл истории:                  {size / 2 ** 20:8.1f} МБ ({len(history.reload)} изменений)')
+    print(f'Запись одной загрузки:         {record_time / DAYS * 1000:8.1f} мс')
+    print(f'Сохранение / загрузка файла:   {save_time * 1000:8.1f} / {load_time * 1000:.1f} мс')
+    latency, _ = timed(lambda: history.price_per_kg('товар 4242', exact=True))
+    print(f'Цена за кг по товару:          {latency:8.3f} мс')
+    latency, _ = timed(lambda: history.price_per_kg('товар 4242'), repeat=5)
+    print(f'Цена за кг по части названия:  {latency:8.3f} мс')
+    since = first_day + datetime.timedelta(days=DAYS - 30)
+    latency, _ = timed(lambda: history.movers(since), repeat=5)
+    print(f'Лидеры изменения за 30 дней:   {latency:8.1f} мс')
+    since = first_day + datetime.timedelta(days=DAYS // 2)
+    latency, _ = timed(lambda: history.movers(since), repeat=5)
+    print(f'Лидеры изменения за полгода:   {latency:8.1f} мс')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import resource
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+import data_download as dd
+import shared_frames as sf
+
+
+ROWS = 4_000_000
+CHUNK = 500_000
+PROCESSES = 4
+
+
+def make_frame(rows):
+    """
+    Creates a synthetic minute OHLCV history.
+    """
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(0, 10_000, rows).astype(float),
+        },
+        index=pd.date_range("2020-01-01", periods=rows, freq="min"),
+    )
+
+
+def _pickle_task(task):
+    # обычный подход: в процесс передается сам DataFrame, обратно - результат
+    data, skip = task
+    data = dd.add_moving_average(dd.calculate_rsi(data))
+    return data.iloc[skip:]
+
+
+def run_pickle(data):
+    tasks = [
+        (data.iloc[max(start - 14, 0):start + CHUNK], start - max(start - 14, 0))
+        for start in range(0, len(data), CHUNK)
+    ]
+    with Pool(PROCESSES) as pool:
+        result = pd.concat(pool.map(_pickle_task, tasks))
+    return result["Close"].std()
+
+
+def run_shared(data):
+    with sf.SharedFrame.from_frame(data) as shared:
+        return sf.compute_indicators(
+            {"TEST": shared}, processes=PROCESSES, chunk_size=CHUNK
+        )["TEST"]
+
+
+def measure(mode):
+    """
+    Runs one mode and prints time and peak RSS. Every mode runs
+    in a separate interpreter so that peak RSS is not shared.
+    """
+    data = make_frame(ROWS)
+    start = time.perf_counter()
+    {"pickle": run_pickle, "shared": run_shared}[mode](data)
+    elapsed = time.perf_counter() - start
+    parent = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(
+        f"{mode:<8} {elapsed:6.2f} с  {ROWS / elapsed / 1e6:6.2f} млн строк/с  "
+        f"пик RSS: главный {parent:6.0f} МБ, процесс-обработчик {children:6.0f} МБ"
+    )
+
+
+def main():
+    print(f"{ROWS} строк, блоки по {CHUNK}, процессов: {PROCESSES}")
+    for mode in ("pickle", "shared"):
+        subprocess.run([sys.executable, __file__, mode], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+    else:
+        main()
@@ -1,6 +1,4 @@
 import logging
-import yfinance as yf
-from plotly import graph_objs as go
 from datetime import date
 
 
@@ -23,6 +21,10 @@ def fetch_stock_data(ticker, period=None, start=None, end=None):
 
     :return data: containing the stock data for the specified parameters
     """
+    # yfinance импортируется только при загрузке данных,
+    # чтобы не замедлять запуск команд, которым он не нужен
+    import yfinance as yf
+
     stock = yf.Ticker(ticker)
     # передаем временной отрезок в зависимости от того, что ввел пользователь
     if not period:
@@ -198,6 +200,41 @@ def export_data_to_csv(data, filename):
     )
 
 
+def export_data_to_json(data, filename):
+    """
+    This function takes a Pandas DataFrame and saves it
+    to a JSON file with the given filename.
+    The index (dates) is saved as a regular column.
+
+    :param data: pd.DataFrame containing the data to be exported.
+    :param filename: str, name of the JSON file to be created.
+
+    :return None
+    """
+    data.reset_index().to_json(filename, orient="records", date_format="iso")
+    logging.info(
+        "%s: Данные записаны в json file",
+        export_data_to_json.__name__,
+    )
+
+
+def export_data_to_html(data, filename):
+    """
+    This function takes a Pandas DataFrame and saves it
+    to an HTML table with the given filename.
+
+    :param data: pd.DataFrame containing the data to be exported.
+    :param filename: str, name of the HTML file to be created.
+
+    :return None
+    """
+    data.to_html(filename)
+    logging.info(
+        "%s: Данные записаны в html file",
+        export_data_to_html.__name__,
+    )
+
+
 def calculate_std(data):
     """
     Calculates the standard deviation of the closing price.
@@ -224,6 +261,7 @@ def interactive_graph(data):
 
     :return None, displays an interactive graph in the console.
     """
+    from plotly import graph_objs as go
 
     fig = go.Figure()
     fig.add_trace(
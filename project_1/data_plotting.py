@@ -1,6 +1,4 @@
 import logging
-import matplotlib.pyplot as plt
-import pandas as pd
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +38,11 @@ def create_and_save_plot(
     Close Price vs. Moving Average vs Standard deviation
     RSI (Relative Strength Index) with the upper and lower threshold lines.
     """
+    # matplotlib и pandas импортируются только при построении графика,
+    # чтобы не замедлять запуск команд, которым они не нужны
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     try:
         plt.style.use(style)
         logging.info(
@@ -88,6 +91,7 @@ def create_and_save_plot(
                 "Информация о дате отсутствует "
                 "или не имеет распознаваемого формата."
             )
+            plt.close()
             return
     else:
         if not pd.api.types.is_datetime64_any_dtype(data['Date']):
@@ -117,6 +121,8 @@ def create_and_save_plot(
             filename = f"{ticker}_{period}_stock_price_chart.png"
 
     plt.savefig(filename)
+    # закрываем фигуру, иначе при построении многих графиков они копятся в памяти
+    plt.close()
     logging.info(
         "%s: График сохранен как %r",
         create_and_save_plot.__name__,
@@ -1,14 +1,28 @@
+import argparse
+import datetime as dt
+import os
+
 import data_download as dd
 import data_plotting as dplt
-import matplotlib.pyplot as plt
-import datetime as dt
 
 
-def main():
+# Тяжелые библиотеки (yfinance, matplotlib, plotly) импортируются внутри
+# функций data_download и data_plotting, поэтому каждая команда
+# загружает только то, что ей действительно нужно.
+EXPORTERS = {
+    "csv": dd.export_data_to_csv,
+    "json": dd.export_data_to_json,
+    "html": dd.export_data_to_html,
+}
+
+
+def run_interactive(args=None):
     print("Добро пожаловать в инструмент получения и построения графиков биржевых данных.")
     print("Вот несколько примеров биржевых тикеров, которые вы можете рассмотреть: AAPL (Apple Inc), GOOGL (Alphabet Inc), MSFT (Microsoft Corporation), AMZN (Amazon.com Inc), TSLA (Tesla Inc).")
     print("Общие периоды времени для данных о запасах включают: 1д, 5д, 1мес, 3мес, 6мес, 1г, 2г, 5г, 10л, с начала года, макс.")
 
+    import matplotlib.pyplot as plt
+
     ticker = input("Введите тикер акции (например, «AAPL» для Apple Inc):»")
     period = input("Введите период для данных (например, '1mo' для одного месяца) или \nнажмите Enter, чтобы ввести даты начала и окончания ")
     if not period:
@@ -47,6 +61,187 @@ def main():
     dd.export_data_to_csv(stock_data,f"{ticker}_data_{dt.date.today()}.csv")
 
 
+def fetch(ticker, args):
+    """
+    Loads the stock data for one ticker using the command line parameters.
+
+    :param ticker: str, the stock ticker symbol
+    :param args: argparse.Namespace with period, start and end
+
+    :return data: pd.DataFrame containing the stock data
+    """
+    return dd.fetch_stock_data(ticker, period=args.period, start=args.start, end=args.end)
+
+
+def add_indicators(data, args):
+    """
+    Adds RSI and moving average columns to the data.
+
+    :param data: pd.DataFrame with a "Close" column containing closing prices.
+    :param args: argparse.Namespace with rsi_window and ma_window
+
+    :return data: pd.DataFrame with "RSI" and "Moving_Average" columns
+    """
+    data = dd.calculate_rsi(data, window=args.rsi_window)
+    return dd.add_moving_average(data, window_size=args.ma_window)
+
+
+def save(data, ticker, kind, args):
+    """
+    Saves the data in every requested format.
+
+    :param data: pd.DataFrame containing the data to be exported.
+    :param ticker: str, the stock ticker symbol
+    :param kind: str, part of the file name ('raw' or 'data')
+    :param args: argparse.Namespace with formats and output_dir
+    """
+    os.makedirs(args.output_dir, exist_ok=True)
+    for fmt in args.formats:
+        filename = os.path.join(
+            args.output_dir, f"{ticker}_{kind}_{dt.date.today()}.{fmt}"
+        )
+        EXPORTERS[fmt](data, filename)
+        print(f"Данные {ticker} сохранены в {filename}")
+
+
+def run_fetch(args):
+    for ticker in args.tickers:
+        save(fetch(ticker, args), ticker, "raw", args)
+
+
+def run_indicators(args):
+    for ticker in args.tickers:
+        data = add_indicators(fetch(ticker, args), args)
+        print(f"{ticker}:")
+        print(f"  Среднее значение цены закрытия: {dd.calculate_and_display_average_price(data)}")
+        print(f"  Стандартное отклонение: {dd.calculate_std(data)}")
+        if not data.empty:
+            print(f"  RSI: {data['RSI'].iloc[-1]}")
+            print(f"  Скользящая средняя: {data['Moving_Average'].iloc[-1]}")
+        if args.treshold is not None:
+            print(f"  {dd.notify_if_strong_fluctuations(data, args.treshold)}")
+
+
+def run_plot(args):
+    for ticker in args.tickers:
+        data = add_indicators(fetch(ticker, args), args)
+        if args.backend == "plotly":
+            dd.interactive_graph(data)
+            continue
+        if args.period:
+            filename = f"{ticker}_{args.period}_stock_price_chart.png"
+        else:
+            filename = f"{ticker}_{args.start}_{args.end}_stock_price_chart.png"
+        os.makedirs(args.output_dir, exist_ok=True)
+        dplt.create_and_save_plot(
+            data,
+            ticker=ticker,
+            period=args.period,
+            start=args.start,
+            end=args.end,
+            style=args.style,
+            std=dd.calculate_std(data),
+            filename=os.path.join(args.output_dir, filename),
+        )
+
+
+def run_export(args):
+    for ticker in args.tickers:
+        save(add_indicators(fetch(ticker, args), args), ticker, "data", args)
+
+
+def build_parser():
+    """
+    Creates the command line parser with all subcommands.
+
+    :return parser: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Инструмент получения и построения графиков биржевых данных."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    # общие параметры для команд, работающих с тикерами
+    tickers = argparse.ArgumentParser(add_help=False)
+    tickers.add_argument("tickers", nargs="+", help="тикеры акций, например AAPL MSFT")
+    tickers.add_argument("-p", "--period", help="период данных, например 1mo (по умолчанию 1mo)")
+    tickers.add_argument("--start", help="дата начала в формате YYYY-MM-DD")
+    tickers.add_argument("--end", help="дата окончания в формате YYYY-MM-DD")
+
+    indicators = argparse.ArgumentParser(add_help=False)
+    indicators.add_argument("--rsi-window", type=int, default=14, help="окно RSI")
+    indicators.add_argument("--ma-window", type=int, default=5, help="окно скользящей средней")
+
+    output_dir = argparse.ArgumentParser(add_help=False)
+    output_dir.add_argument("-o", "--output-dir", default=".", help="каталог для файлов")
+
+    output = argparse.ArgumentParser(add_help=False, parents=[output_dir])
+    output.add_argument(
+        "-f", "--formats", nargs="+", choices=sorted(EXPORTERS), default=["csv"],
+        help="форматы сохранения",
+    )
+
+    command = subparsers.add_parser(
+        "fetch", parents=[tickers, output], help="загрузить и сохранить исходные данные"
+    )
+    command.set_defaults(func=run_fetch)
+
+    command = subparsers.add_parser(
+        "indicators", parents=[tickers, indicators], help="вывести индикаторы"
+    )
+    command.add_argument("-t", "--treshold", type=float, help="порог сильных колебаний")
+    command.set_defaults(func=run_indicators)
+
+    command = subparsers.add_parser(
+        "plot", parents=[tickers, indicators, output_dir], help="построить график"
+    )
+    command.add_argument(
+        "-b", "--backend", choices=["matplotlib", "plotly"], default="matplotlib",
+        help="matplotlib сохраняет png, plotly открывает интерактивный график",
+    )
+    command.add_argument("-s", "--style", default="ggplot", help="стиль графика matplotlib")
+    command.set_defaults(func=run_plot)
+
+    command = subparsers.add_parser(
+        "export", parents=[tickers, indicators, output],
+        help="сохранить данные вместе с индикаторами",
+    )
+    command.set_defaults(func=run_export)
+
+    command = subparsers.add_parser("interactive", help="пошаговый режим с вопросами")
+    command.set_defaults(func=run_interactive)
+    return parser
+
+
+def parse_args(argv=None):
+    """
+    Parses the command line and fills in the effective period.
+
+    :param argv: list of str, optional, arguments without the program name
+
+    :return args: argparse.Namespace
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if "tickers" in args:
+        if args.end and not args.start:
+            parser.error("--end можно указать только вместе с --start")
+        if args.period and args.start:
+            parser.error("укажите либо --period, либо --start и --end")
+        # один и тот же период используется для загрузки и в имени графика
+        if not args.period and not args.start:
+            args.period = "1mo"
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # без команды сохраняется прежнее поведение - пошаговый режим
+    if args.command is None:
+        run_interactive()
+        return
+    args.func(args)
+
 
 if __name__ == "__main__":
     main()
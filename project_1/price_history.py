@@ -0,0 +1,205 @@
+import datetime
+import json
+import os
+import tempfile
+import zlib
+from array import array
+from bisect import bisect_right
+
+
+class PriceHistory():
+    '''
+        История цен по всем загрузкам прайс-листов.
+
+        При каждой загрузке сохраняются только изменения относительно
+        предыдущей: новая цена или фасовка товара в файле, появление
+        или исчезновение товара. Изменения хранятся в плотных массивах
+        целых чисел, каждое изменение ссылается на предыдущее изменение
+        того же товара, поэтому история товара читается без просмотра
+        остальных загрузок.
+    '''
+
+    version = 1
+
+    def __init__(self):
+        # даты загрузок (порядковый номер дня)
+        self.dates = array('i')
+        # товары: (название, файл) и индекс по названию
+        self.keys = []
+        self.key_ids = {}
+        self.names = {}
+        # номер последнего изменения каждого товара, -1 если изменений нет
+        self.last = array('i')
+        # изменения: номер загрузки, цена, вес (0 - товар исчез),
+        # номер предыдущего изменения того же товара
+        self.reload = array('i')
+        self.price = array('i')
+        self.weight = array('i')
+        self.prev = array('i')
+
+    def _key_id(self, product_name, file_name):
+        key = (product_name, file_name)
+        key_id = self.key_ids.get(key)
+        if key_id is None:
+            key_id = len(self.keys)
+            self.keys.append(key)
+            self.key_ids[key] = key_id
+            self.names.setdefault(product_name, []).append(key_id)
+            self.last.append(-1)
+        return key_id
+
+    def _append(self, key_id, reload, price, weight):
+        self.reload.append(reload)
+        self.price.append(price)
+        self.weight.append(weight)
+        self.prev.append(self.last[key_id])
+        self.last[key_id] = len(self.reload) - 1
+
+    def record(self, data, day=None):
+        '''
+            Записывает загрузку как набор изменений.
+            data - строки в формате PriceMachine.data:
+            (цена за кг, название, цена, вес, файл).
+            Возвращает количество записанных изменений.
+        '''
+        day = (day or datetime.date.today()).toordinal()
+        if self.dates and day < self.dates[-1]:
+            raise ValueError('Дата загрузки раньше последней записанной')
+        reload = len(self.dates)
+        self.dates.append(day)
+        count = len(self.reload)
+
+        seen = set()
+        for value, product_name, price, weight, file_name in data:
+            key_id = self._key_id(product_name, file_name)
+            if key_id in seen:
+                continue
+            seen.add(key_id)
+            position = self.last[key_id]
+            if (position < 0 or self.price[position] != price
+                    or self.weight[position] != weight):
+                self._append(key_id, reload, price, weight)
+        # товары, которых нет в новой загрузке, отмечаются весом 0
+        for key_id, position in enumerate(self.last):
+            if position >= 0 and key_id not in seen and self.weight[position]:
+                self._append(key_id, reload, 0, 0)
+        return len(self.reload) - count
+
+    def _find(self, text, exact=False):
+        text = text.lower()
+        if exact:
+            return self.names.get(text, [])
+        return [key_id for key_id, key in enumerate(self.keys) if text in key[0]]
+
+    def _changes(self, key_id):
+        position = self.last[key_id]
+        while position >= 0:
+            yield position
+            position = self.prev[position]
+
+    def _value(self, position):
+        if position < 0 or not self.weight[position]:
+            return None
+        return round(self.price[position] / self.weight[position], 2)
+
+    def price_per_kg(self, text, exact=False):
+        '''
+            Возвращает историю цены за кг для товаров, в названии которых
+            есть text (или с названием text, если exact=True):
+            {(название, файл): [(дата, цена за кг), ...]}.
+            Цена None означает, что товар исчез из прайс-листа.
+        '''
+        result = {}
+        for key_id in self._find(text, exact):
+            history = [
+                (datetime.date.fromordinal(self.dates[self.reload[position]]),
+                 self._value(position))
+                for position in self._changes(key_id)
+            ]
+            history.reverse()
+            result[self.keys[key_id]] = history
+        return result
+
+    def movers(self, since, limit=10):
+        '''
+            Возвращает товары с наибольшим изменением цены за кг
+            с даты since до последней загрузки. Товары, появившиеся
+            после since, сравниваются со своей первой ценой:
+            [(изменение в %, название, файл, цена тогда, цена сейчас), ...]
+        '''
+        # если since раньше первой загрузки, сравниваем с первой загрузкой
+        reload = max(bisect_right(self.dates, since.toordinal()) - 1, 0)
+        result = []
+        for key_id in range(len(self.keys)):
+            now = self._value(self.last[key_id])
+            if now is None:
+                continue
+            # идем назад только по изменениям, сделанным после since;
+            # товар, появившийся позже since, сравнивается с первой ценой
+            position = self.last[key_id]
+            while self.reload[position] > reload and self.prev[position] >= 0:
+                position = self.prev[position]
+            before = self._value(position)
+            if not before or before == now:
+                continue
+            percent = round((now - before) / before * 100, 2)
+            result.append((percent, *self.keys[key_id], before, now))
+        result.sort(key=lambda item: abs(item[0]), reverse=True)
+        return result[:limit]
+
+    def save(self, fname='price_history.bin'):
+        '''
+            Сохраняет историю в один сжатый файл.
+            Файл заменяется целиком только после успешной записи.
+        '''
+        header = json.dumps({
+            'version': self.version,
+            'keys': self.keys,
+        }, ensure_ascii=False).encode('utf-8')
+        columns = (self.dates, self.last, self.reload, self.price, self.weight, self.prev)
+        sizes = array('q', [len(header)] + [len(column) for column in columns])
+        payload = sizes.tobytes() + header + b''.join(column.tobytes() for column in columns)
+        # пишем во временный файл рядом и заменяем им старый, чтобы сбой
+        # во время записи не оставил историю обрезанной
+        descriptor, temp_name = tempfile.mkstemp(
+            prefix='.price_history_', dir=os.path.dirname(os.path.abspath(fname)))
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                f.write(zlib.compress(payload, 6))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, fname)
+        except BaseException:
+            os.remove(temp_name)
+            raise
+        return os.path.getsize(fname)
+
+    @classmethod
+    def load(cls, fname='price_history.bin'):
+        '''
+            Загружает историю из файла или создает пустую, если файла нет.
+        '''
+        history = cls()
+        if not os.path.exists(fname):
+            return history
+        with open(fname, 'rb') as f:
+            payload = zlib.decompress(f.read())
+        sizes = array('q')
+        sizes.frombytes(payload[:7 * sizes.itemsize])
+        offset = 7 * sizes.itemsize
+        header = json.loads(payload[offset:offset + sizes[0]].decode('utf-8'))
+        if header['version'] != cls.version:
+            raise ValueError(f'Неизвестная версия файла истории: {header["version"]}')
+        offset += sizes[0]
+        columns = ('dates', 'last', 'reload', 'price', 'weight', 'prev')
+        for name, size in zip(columns, sizes[1:]):
+            column = getattr(history, name)
+            end = offset + size * column.itemsize
+            column.frombytes(payload[offset:end])
+            offset = end
+        for key_id, (product_name, file_name) in enumerate(header['keys']):
+            key = (product_name, file_name)
+            history.keys.append(key)
+            history.key_ids[key] = key_id
+            history.names.setdefault(product_name, []).append(key_id)
+        return history
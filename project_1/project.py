@@ -1,17 +1,20 @@
 import os
 import json
 
+from price_history import PriceHistory
+
 
 class PriceMachine():
     
-    def __init__(self):
+    def __init__(self, history=None):
         self.data = []
         self.result = ''
         self.name_length = 0
+        self.history = history
     
     def load_prices(self, file_path=''):
         '''
-            Сканирует указанный каталог. Ищет файлы со словом price в названии.
+            Сканирует указанный каталог. Ищет csv файлы со словом price в названии.
             В файле ищет столбцы с названием товара, ценой и весом.
             Допустимые названия для столбца с товаром:
                 товар
@@ -35,7 +38,8 @@ class PriceMachine():
         if not file_path:
             file_path = current_path
         for file_name in os.listdir(file_path):
-            if 'price' in file_name :
+            # только csv, чтобы не читать файл истории и модули с price в названии
+            if 'price' in file_name and file_name.endswith('.csv'):
                 count_files += 1
                 print('read',file_name)
                 with open(os.path.join(file_path, file_name), 'r') as f:
@@ -53,6 +57,8 @@ class PriceMachine():
                         value = round(price / weight,2)
                         self.data.append((value, product_name, price, weight, file_name))
         self.data.sort()
+        if self.history is not None:
+            self.history.record(self.data)
         return count_files, count_lines
         
     def _search_product_price_weight(self, headers):
@@ -112,8 +118,11 @@ class PriceMachine():
         return data
 
     
-pm = PriceMachine()
+history_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'price_history.bin')
+history = PriceHistory.load(history_path)
+pm = PriceMachine(history)
 print(pm.load_prices())
+history.save(history_path)
 while 1:
     command = input('Введите exit для выхода или часть названия для поиска: \n')
     if command == 'exit':
@@ -0,0 +1,254 @@
+import logging
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+import pandas as pd
+
+import data_download as dd
+import data_plotting as dplt
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    filename="logging.log",
+    filemode="w",
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+
+OHLCV = ("Open", "High", "Low", "Close", "Volume")
+RESULTS = ("RSI", "Moving_Average")
+
+
+class SharedFrame:
+    """
+    Stores the columns of a DataFrame in one shared memory block.
+
+    The block holds the index as int64 nanoseconds followed by a
+    (rows x columns) float64 matrix. Worker processes receive only
+    the lightweight handle and rebuild the DataFrame as a view,
+    without copying or pickling the data.
+    """
+
+    def __init__(self, shm, columns, length, tz=None, has_dates=True):
+        self.shm = shm
+        self.columns = tuple(columns)
+        self.length = length
+        self.tz = tz
+        self.has_dates = has_dates
+        self.index_values = np.ndarray(
+            (length,), dtype=np.int64, buffer=shm.buf
+        )
+        self.values = np.ndarray(
+            (length, len(self.columns)),
+            dtype=np.float64,
+            buffer=shm.buf,
+            offset=length * 8,
+        )
+
+    @classmethod
+    def create(cls, columns, length, tz=None, has_dates=True):
+        """
+        Allocates a new shared block filled with NaN.
+
+        :param columns: sequence of str, column names
+        :param length: int, number of rows
+        :param tz: str, optional, time zone of the index
+        :param has_dates: bool, whether the index holds dates
+
+        :return shared: SharedFrame
+        """
+        size = max(length * 8 * (len(columns) + 1), 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        shared = cls(shm, columns, length, tz, has_dates)
+        shared.values.fill(np.nan)
+        return shared
+
+    @classmethod
+    def from_frame(cls, data, columns=OHLCV, extra=RESULTS):
+        """
+        Copies the data into shared memory once.
+
+        :param data: pd.DataFrame with the columns listed in columns
+        :param columns: sequence of str, columns copied from data
+        :param extra: sequence of str, empty columns for worker results
+
+        :return shared: SharedFrame
+        """
+        has_dates = isinstance(data.index, pd.DatetimeIndex)
+        tz = str(data.index.tz) if has_dates and data.index.tz else None
+        shared = cls.create(tuple(columns) + tuple(extra), len(data), tz, has_dates)
+        if has_dates:
+            # asi8 у индекса с часовым поясом хранит время в UTC
+            shared.index_values[:] = data.index.as_unit("ns").asi8
+        else:
+            shared.index_values[:] = np.arange(len(data))
+        for number, column in enumerate(columns):
+            shared.values[:, number] = data[column].to_numpy(dtype=np.float64)
+        logging.info(
+            "%s: В общую память помещено %s строк",
+            cls.from_frame.__name__,
+            len(data),
+        )
+        return shared
+
+    @classmethod
+    def attach(cls, handle):
+        """
+        Connects to an existing block by its handle.
+
+        :param handle: tuple returned by the handle property
+
+        :return shared: SharedFrame
+        """
+        name, columns, length, tz, has_dates = handle
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, columns, length, tz, has_dates)
+
+    @property
+    def handle(self):
+        """
+        A small picklable description of the block for worker processes.
+        """
+        return self.shm.name, self.columns, self.length, self.tz, self.has_dates
+
+    def frame(self, start=0, stop=None):
+        """
+        Builds a DataFrame view over the shared rows without copying.
+
+        :param start: int, first row
+        :param stop: int, optional, row after the last one
+
+        :return data: pd.DataFrame backed by the shared memory
+        """
+        stop = self.length if stop is None else stop
+        if self.has_dates:
+            dtype = pd.DatetimeTZDtype(tz=self.tz) if self.tz else "M8[ns]"
+            values = self.index_values[start:stop]
+            if not self.tz:
+                values = values.view("M8[ns]")
+            index = pd.DatetimeIndex(values, dtype=dtype, copy=False)
+        else:
+            index = pd.RangeIndex(start, stop)
+        return pd.DataFrame(
+            self.values[start:stop],
+            index=index,
+            columns=list(self.columns),
+            copy=False,
+        )
+
+    def close(self):
+        """
+        Releases the views and detaches from the block.
+        DataFrames returned by frame() must be deleted before this call.
+        """
+        self.index_values = None
+        self.values = None
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Closes and removes the block. Called once by the owner.
+        """
+        self.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.unlink()
+
+
+def _indicators_task(task):
+    """
+    Worker: calculates RSI and moving average for a range of rows
+    and writes them into the result columns of the shared block.
+    """
+    handle, start, stop, rsi_window, ma_window = task
+    shared = SharedFrame.attach(handle)
+    try:
+        # захватываем предыдущие строки, чтобы скользящие окна
+        # на границе диапазона считались так же, как для всего ряда
+        warmup = max(start - max(rsi_window, ma_window), 0)
+        data = shared.frame(warmup, stop)[["Close"]]
+        data = dd.calculate_rsi(data, window=rsi_window)
+        data = dd.add_moving_average(data, window_size=ma_window)
+        skip = start - warmup
+        for column in RESULTS:
+            number = shared.columns.index(column)
+            shared.values[start:stop, number] = data[column].to_numpy()[skip:]
+        del data
+    finally:
+        shared.close()
+    return stop - start
+
+
+def _plot_task(task):
+    """
+    Worker: draws the chart for one shared block.
+    """
+    handle, ticker, period, std, style = task
+    shared = SharedFrame.attach(handle)
+    try:
+        dplt.create_and_save_plot(
+            shared.frame(), ticker=ticker, period=period, std=std, style=style
+        )
+    finally:
+        shared.close()
+    return ticker
+
+
+def compute_indicators(frames, processes=None, chunk_size=1_000_000,
+                       rsi_window=14, ma_window=5):
+    """
+    Calculates RSI, moving average and standard deviation in parallel.
+
+    Long histories are split into chunks of rows, every worker gets
+    only the handle of the shared block and the row range.
+
+    :param frames: dict of ticker -> SharedFrame
+    :param processes: int, optional, number of worker processes
+    :param chunk_size: int, number of rows per task
+    :param rsi_window: int, the window for calculating RSI
+    :param ma_window: int, the size of the moving average window
+
+    :return stds: dict of ticker -> standard deviation of the closing price
+    """
+    tasks = [
+        (shared.handle, start, min(start + chunk_size, shared.length),
+         rsi_window, ma_window)
+        for shared in frames.values()
+        for start in range(0, shared.length, chunk_size)
+    ]
+    with Pool(processes) as pool:
+        rows = sum(pool.map(_indicators_task, tasks))
+    logging.info(
+        "%s: Индикаторы рассчитаны для %s строк в %s задачах",
+        compute_indicators.__name__,
+        rows,
+        len(tasks),
+    )
+    return {
+        ticker: dd.calculate_std(shared.frame())
+        for ticker, shared in frames.items()
+    }
+
+
+def plot_in_parallel(frames, stds, period=None, style="ggplot", processes=None):
+    """
+    Draws and saves charts for every ticker in parallel.
+
+    :param frames: dict of ticker -> SharedFrame with indicator columns
+    :param stds: dict of ticker -> standard deviation of the closing price
+    :param period: str, optional, the time period used in file names
+    :param style: str, style to apply to the plot
+    :param processes: int, optional, number of worker processes
+
+    :return tickers: list of str, tickers whose charts were saved
+    """
+    tasks = [
+        (shared.handle, ticker, period, stds[ticker], style)
+        for ticker, shared in frames.items()
+    ]
+    with Pool(processes) as pool:
+        return pool.map(_plot_task, tasks)
@@ -1,7 +1,20 @@
+import contextlib
+import datetime
+import io
+import os
 import random
+import tempfile
 import unittest
+from unittest import mock
 
-from data_download import fetch_stock_data, calculate_and_display_average_price, notify_if_strong_fluctuations
+import numpy as np
+import pandas as pd
+
+from data_download import fetch_stock_data, calculate_and_display_average_price, notify_if_strong_fluctuations, calculate_rsi, add_moving_average
+import main
+from main import parse_args
+from price_history import PriceHistory
+from shared_frames import SharedFrame, compute_indicators, plot_in_parallel
 
 
 stocks = ["AAPL", "FF", "DAX", "GOOG", "AMZN"]
@@ -23,5 +36,171 @@ class RunTest(unittest.TestCase):
         self.assertIsInstance(notification, str, msg)
 
 
+class CommandLineTest(unittest.TestCase):
+    def assertRejected(self, argv):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            parse_args(argv)
+
+    def test_many_tickers_and_formats(self):
+        args = parse_args(["export", "AAPL", "MSFT", "-f", "csv", "json", "-p", "1y"])
+        self.assertEqual(args.tickers, ["AAPL", "MSFT"])
+        self.assertEqual(args.formats, ["csv", "json"])
+        self.assertEqual(args.period, "1y")
+
+    def test_default_period(self):
+        msg = "Период по умолчанию не подставлен"
+        args = parse_args(["plot", "AAPL"])
+        self.assertEqual(args.period, "1mo", msg)
+        args = parse_args(["plot", "AAPL", "--start", "2024-01-01", "--end", "2024-02-01"])
+        self.assertIsNone(args.period, msg)
+
+    def test_treshold_is_float(self):
+        self.assertEqual(parse_args(["indicators", "AAPL", "-t", "10.5"]).treshold, 10.5)
+        self.assertRejected(["indicators", "AAPL", "-t", "abc"])
+
+    def test_invalid_dates_rejected(self):
+        self.assertRejected(["fetch", "AAPL", "--end", "2024-01-01"])
+        self.assertRejected(["fetch", "AAPL", "-p", "1y", "--start", "2024-01-01"])
+        self.assertRejected(["export", "AAPL", "-f", "xml"])
+
+    def test_plot_output_dir(self):
+        msg = "График не сохранен в каталог -o или фигура не закрыта"
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        close = np.linspace(1, 40, 40)
+        data = pd.DataFrame({"Close": close, "High": close + 1, "Low": close - 1},
+                            index=pd.date_range("2024-01-01", periods=40))
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch("data_download.fetch_stock_data", side_effect=lambda *a, **k: data.copy()), \
+                contextlib.redirect_stdout(io.StringIO()):
+            main.main(["plot", "AAPL", "MSFT", "-o", directory])
+            for ticker in ("AAPL", "MSFT"):
+                path = os.path.join(directory, f"{ticker}_1mo_stock_price_chart.png")
+                self.assertTrue(os.path.exists(path), msg)
+        self.assertEqual(plt.get_fignums(), [], msg)
+
+    def test_no_command(self):
+        self.assertIsNone(parse_args([]).command)
+
+
+class SharedFrameTest(unittest.TestCase):
+    def setUp(self):
+        close = np.linspace(100, 50, 200) + np.sin(np.arange(200))
+        self.data = pd.DataFrame(
+            {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1.0},
+            index=pd.date_range("2023-01-01", periods=200, tz="America/New_York"),
+        )
+        self.shared = SharedFrame.from_frame(self.data)
+
+    def tearDown(self):
+        if self.shared is not None:
+            self.shared.unlink()
+
+    def test_frame_is_view(self):
+        msg = "Данные скопированы из общей памяти"
+        view = self.shared.frame()
+        self.assertTrue(np.shares_memory(view["Close"].to_numpy(), self.shared.values), msg)
+        self.assertTrue(view.index.equals(self.data.index))
+        del view
+
+    def test_indicators_match_serial(self):
+        msg = "Результат отличается от последовательного расчета"
+        stds = compute_indicators({"TEST": self.shared}, processes=2, chunk_size=30)
+        expected = add_moving_average(calculate_rsi(self.data.copy()))
+        view = self.shared.frame()
+        for column in ("RSI", "Moving_Average"):
+            np.testing.assert_allclose(view[column], expected[column], err_msg=msg)
+        self.assertAlmostEqual(stds["TEST"], expected["Close"].std())
+        del view
+
+    def test_plot_in_parallel(self):
+        msg = "График из общей памяти не сохранен"
+        import matplotlib
+        matplotlib.use("Agg")
+
+        stds = compute_indicators({"TEST": self.shared}, processes=1)
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            # create_and_save_plot сохраняет график в текущий каталог
+            os.chdir(directory)
+            try:
+                tickers = plot_in_parallel({"TEST": self.shared}, stds, period="1d", processes=1)
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(tickers, ["TEST"], msg)
+            self.assertTrue(os.path.exists(os.path.join(directory, "TEST_1d_stock_price_chart.png")), msg)
+        # после работы обработчиков блок общей памяти должен освобождаться
+        shared, self.shared = self.shared, None
+        shared.unlink()
+
+
+class PriceHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.history = PriceHistory()
+        self.history.record([(1.0, "сыр", 100, 100, "price_1.csv"), (2.0, "хлеб", 20, 10, "price_1.csv")],
+                            datetime.date(2024, 1, 1))
+
+    def test_only_changes_are_recorded(self):
+        msg = "Записаны неизмененные цены"
+        changes = self.history.record([(1.0, "сыр", 100, 100, "price_1.csv"), (3.0, "хлеб", 30, 10, "price_1.csv")],
+                                      datetime.date(2024, 1, 2))
+        self.assertEqual(changes, 1, msg)
+
+    def test_price_history_and_movers(self):
+        msg = "Неверная история цены"
+        self.history.record([(1.5, "сыр", 150, 100, "price_1.csv")], datetime.date(2024, 1, 3))
+        history = self.history.price_per_kg("хлеб", exact=True)[("хлеб", "price_1.csv")]
+        self.assertEqual(history, [(datetime.date(2024, 1, 1), 2.0), (datetime.date(2024, 1, 3), None)], msg)
+        movers = self.history.movers(datetime.date(2024, 1, 1))
+        self.assertEqual(movers, [(50.0, "сыр", "price_1.csv", 1.0, 1.5)], msg)
+
+    def test_movers_before_first_reload(self):
+        msg = "Дата раньше первой загрузки не сравнивается с первой ценой"
+        self.history.record([(1.5, "сыр", 150, 100, "price_1.csv"), (2.0, "хлеб", 20, 10, "price_1.csv")],
+                            datetime.date(2024, 1, 2))
+        movers = self.history.movers(datetime.date(2023, 12, 1))
+        self.assertEqual(movers, [(50.0, "сыр", "price_1.csv", 1.0, 1.5)], msg)
+
+    def test_movers_skip_unchanged(self):
+        msg = "Товар без изменения цены попал в лидеры"
+        self.history.record([(1.0, "сыр", 100, 100, "price_1.csv")], datetime.date(2024, 1, 2))
+        self.history.record([(1.0, "сыр", 100, 100, "price_1.csv"), (2.0, "хлеб", 20, 10, "price_1.csv")],
+                            datetime.date(2024, 1, 3))
+        self.assertEqual(self.history.movers(datetime.date(2024, 1, 1)), [], msg)
+
+    def test_save_load_round_trip(self):
+        msg = "История после сохранения и загрузки отличается"
+        self.history.record([(1.5, "сыр", 150, 100, "price_1.csv"), (4.0, "молоко", 40, 10, "price_2.csv")],
+                            datetime.date(2024, 1, 5))
+        with tempfile.TemporaryDirectory() as directory:
+            fname = os.path.join(directory, "history.bin")
+            self.history.save(fname)
+            loaded = PriceHistory.load(fname)
+            self.assertEqual(PriceHistory.load(os.path.join(directory, "missing.bin")).keys, [], msg)
+        for column in ("dates", "last", "reload", "price", "weight", "prev"):
+            self.assertEqual(getattr(loaded, column), getattr(self.history, column), msg)
+        self.assertEqual(loaded.keys, self.history.keys, msg)
+        self.assertEqual(loaded.price_per_kg("о"), self.history.price_per_kg("о"), msg)
+        self.assertEqual(loaded.movers(datetime.date(2024, 1, 1)), self.history.movers(datetime.date(2024, 1, 1)), msg)
+        # загруженная история продолжает записывать изменения
+        changes = loaded.record([(1.5, "сыр", 150, 100, "price_1.csv")], datetime.date(2024, 1, 6))
+        self.assertEqual(changes, 1, msg)
+
+    def test_failed_save_keeps_previous_file(self):
+        msg = "Неудачное сохранение испортило прежний файл истории"
+        with tempfile.TemporaryDirectory() as directory:
+            fname = os.path.join(directory, "history.bin")
+            self.history.save(fname)
+            self.history.record([(1.5, "сыр", 150, 100, "price_1.csv")], datetime.date(2024, 1, 2))
+            for failing in ("os.fsync", "os.replace"):
+                with mock.patch(failing, side_effect=KeyboardInterrupt), self.assertRaises(KeyboardInterrupt):
+                    self.history.save(fname)
+                loaded = PriceHistory.load(fname)
+                self.assertEqual(len(loaded.dates), 1, msg)
+                self.assertEqual(os.listdir(directory), ["history.bin"], msg)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
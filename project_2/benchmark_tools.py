@@ -0,0 +1,104 @@
+import time
+import tkinter as tk
+
+import numpy as np
+
+import tools
+
+
+WIDTH, HEIGHT = 3840, 2160
+REPEAT = 20
+
+
+def measure(name, operation, prepare=None, photo=None):
+    """
+    Выводит медиану времени операции, кодирования изменённой области
+    и записи области в PhotoImage в миллисекундах.
+
+    Args:
+        name (str): Название операции.
+        operation (callable): Операция, принимающая массив пикселей и возвращающая область.
+        prepare (callable): Функция, создающая новый массив пикселей перед каждым запуском.
+        photo (tk.PhotoImage): Изображение холста; без дисплея None, запись не замеряется.
+    """
+    pixels = prepare() if prepare else blank()
+    timings = []
+    for _ in range(REPEAT):
+        if prepare:
+            pixels = prepare()
+        start = time.perf_counter()
+        bbox = operation(pixels)
+        operated = time.perf_counter()
+        encoded = written = operated
+        if bbox is not None:
+            data = tools.region_to_ppm(pixels, bbox)
+            encoded = time.perf_counter()
+            if photo is not None:
+                photo.put(data, to=bbox[:2])
+            written = time.perf_counter()
+        timings.append((operated - start, encoded - operated, written - encoded))
+    operation_time, encoding_time, writing_time = np.median(timings, axis=0) * 1000
+    writing = f'{writing_time:8.2f}' if photo is not None else f'{"-":>8}'
+    total = operation_time + encoding_time + (writing_time if photo is not None else 0)
+    print(f'{name:<40} {operation_time:8.2f} {encoding_time:8.2f} {writing} {total:8.2f}')
+
+
+def blank():
+    return np.full((HEIGHT, WIDTH, 3), 255, dtype=np.uint8)
+
+
+def with_frame():
+    # рамка делит холст на две области, заливается внутренняя
+    pixels = blank()
+    pixels[HEIGHT // 4, WIDTH // 4:WIDTH * 3 // 4] = 0
+    pixels[HEIGHT * 3 // 4, WIDTH // 4:WIDTH * 3 // 4] = 0
+    pixels[HEIGHT // 4:HEIGHT * 3 // 4, WIDTH // 4] = 0
+    pixels[HEIGHT // 4:HEIGHT * 3 // 4, WIDTH * 3 // 4] = 0
+    return pixels
+
+
+def noisy():
+    # 20% случайных тёмных точек, как после спрея
+    pixels = blank()
+    rng = np.random.default_rng(0)
+    pixels[rng.random((HEIGHT, WIDTH)) < 0.2] = 0
+    return pixels
+
+
+def main():
+    try:
+        root = tk.Tk()
+        root.withdraw()
+        photo = tk.PhotoImage(width=WIDTH, height=HEIGHT)
+    except tk.TclError:
+        # без дисплея замеряются только операция и кодирование области
+        root = photo = None
+        print('Дисплей недоступен: запись в PhotoImage не замеряется')
+
+    print(f'Холст {WIDTH}x{HEIGHT}, медиана из {REPEAT} запусков, мс')
+    print(f'{"Операция":<40} {"операция":>8} {"PPM":>8} {"put":>8} {"всего":>8}')
+    black, red = (0, 0, 0), (255, 0, 0)
+    measure('Кисть, отрезок 50 px, размер 10',
+            lambda p: tools.stroke(p, (1000, 1000), (1050, 1000), 5, black), photo=photo)
+    measure('Мягкая кисть, отрезок 50 px, размер 40',
+            lambda p: tools.stroke(p, (1000, 1000), (1050, 1000), 20, black, hardness=0.3),
+            photo=photo)
+    measure('Спрей, отрезок 50 px, радиус 40',
+            lambda p: tools.spray(p, (1000, 1000), (1050, 1000), 40, black), photo=photo)
+    measure('Ластик, отрезок 50 px, размер 20',
+            lambda p: tools.erase(p, (1000, 1000), (1050, 1000), 10), photo=photo)
+    measure('Заливка всего холста',
+            lambda p: tools.flood_fill(p, 0, 0, red), prepare=blank, photo=photo)
+    measure('Заливка внутри рамки (1/4 холста)',
+            lambda p: tools.flood_fill(p, WIDTH // 2, HEIGHT // 2, red),
+            prepare=with_frame, photo=photo)
+    measure('Заливка холста с 20% шума',
+            lambda p: tools.flood_fill(p, 0, 0, red), prepare=noisy, photo=photo)
+    measure('Кодирование всего холста (для сравнения)',
+            lambda p: (0, 0, WIDTH, HEIGHT), photo=photo)
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == '__main__':
+    main()
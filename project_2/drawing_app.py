@@ -1,8 +1,11 @@
 import tkinter as tk
 from tkinter import colorchooser, filedialog, messagebox
-from PIL import Image, ImageDraw
+from PIL import Image, ImageColor
+import numpy as np
 import logging
 
+import tools
+
 
 logging.basicConfig(filename='drawing_app.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,16 +16,24 @@ class DrawingApp:
 
     Атрибуты:
         root (tk.Tk): Корневой объект приложения Tkinter.
-        image (Image.Image): Объект изображения PIL, используемый для рисования.
-        draw (ImageDraw.Draw): Объект для рисования на изображении.
+        pixels (np.ndarray): Массив пикселей изображения (высота, ширина, 3).
+        photo (tk.PhotoImage): Изображение, отображаемое на холсте.
         canvas (tk.Canvas): Полотно для отображения изображения.
         last_x (int): Координата x последней точки рисования.
         last_y (int): Координата y последней точки рисования.
         pen_color (str): Цвет пера.
+        pen_rgb (tuple): Цвет пера в виде (r, g, b).
         brush_size (int): Размер кисти.
         brush_size_variable (tk.StringVar): Переменная для хранения выбранного размера кисти.
         brush_size_menu (tk.OptionMenu): Выпадающее меню для выбора размера кисти.
+        tool (str): Текущий инструмент.
+        tool_variable (tk.StringVar): Переменная для хранения выбранного инструмента.
+        tool_menu (tk.OptionMenu): Выпадающее меню для выбора инструмента.
     """
+    width, height = 600, 400
+    background = (255, 255, 255)
+    tools_list = ['Кисть', 'Мягкая кисть', 'Спрей', 'Ластик', 'Заливка']
+
     def __init__(self, root):
         """
         Инициализирует приложение для рисования.
@@ -33,18 +44,21 @@ class DrawingApp:
         self.root = root
         self.root.title("Рисовалка с сохранением в PNG")
 
-        self.image = Image.new("RGB", (600, 400), "white")
-        self.draw = ImageDraw.Draw(self.image)
-
-        self.canvas = tk.Canvas(root, width=600, height=400, bg='white')
+        self.canvas = tk.Canvas(root, width=self.width, height=self.height, bg='white')
         self.canvas.pack()
+        self.photo = tk.PhotoImage(width=self.width, height=self.height)
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        self.new_image()
 
         self.setup_ui()
 
         self.last_x, self.last_y = None, None
         self.pen_color = 'black'
+        self.pen_rgb = ImageColor.getrgb(self.pen_color)
         self.brush_size = 5
+        self.tool = self.tools_list[0]
 
+        self.canvas.bind('<Button-1>', self.press)
         self.canvas.bind('<B1-Motion>', self.paint)
         self.canvas.bind('<ButtonRelease-1>', self.reset)
 
@@ -73,20 +87,74 @@ class DrawingApp:
                                              command=self.update_brush_size)
         self.brush_size_menu.pack(side=tk.RIGHT)
 
+        self.tool_variable = tk.StringVar(control_frame)
+        self.tool_variable.set(self.tools_list[0])
+        self.tool_menu = tk.OptionMenu(control_frame, self.tool_variable, *self.tools_list,
+                                       command=self.update_tool)
+        self.tool_menu.pack(side=tk.RIGHT)
+
+    def new_image(self):
+        """
+        Создает чистое изображение и выводит его на холст.
+        """
+        self.pixels = np.full((self.height, self.width, 3), self.background, dtype=np.uint8)
+        self.refresh((0, 0, self.width, self.height))
+
+    def refresh(self, bbox):
+        """
+        Обновляет на холсте только изменённую область одной записью в PhotoImage.
+
+        Args:
+            bbox (tuple | None): Изменённая область (x0, y0, x1, y1).
+        """
+        if bbox is None:
+            return
+        self.photo.put(tools.region_to_ppm(self.pixels, bbox), to=bbox[:2])
+
+    def press(self, event):
+        """
+        Обрабатывает нажатие кнопки мыши: заливает область или ставит точку.
+        """
+        color = self.pen_rgb
+        if self.tool == 'Заливка':
+            try:
+                bbox = tools.flood_fill(self.pixels, event.x, event.y, color)
+            except ImportError:
+                messagebox.showerror("Ошибка", "Для заливки нужно установить scipy.")
+                logging.error("Заливка недоступна: не установлен scipy.")
+                return
+            logging.debug(f"Заливка из точки ({event.x}, {event.y}), область {bbox}")
+        else:
+            bbox = self.apply_tool((event.x, event.y), (event.x, event.y), color)
+            self.last_x, self.last_y = event.x, event.y
+        self.refresh(bbox)
+
+    def apply_tool(self, start, end, color):
+        """
+        Применяет текущий инструмент к отрезку и возвращает изменённую область.
+        """
+        radius = self.brush_size / 2
+        if self.tool == 'Мягкая кисть':
+            return tools.stroke(self.pixels, start, end, radius * 2, color, hardness=0.3)
+        if self.tool == 'Спрей':
+            return tools.spray(self.pixels, start, end, radius * 4, color)
+        if self.tool == 'Ластик':
+            return tools.erase(self.pixels, start, end, radius * 2, self.background)
+        return tools.stroke(self.pixels, start, end, radius, color)
+
     def paint(self, event):
         """
-        Рисует линию на холсте и изображении.
+        Рисует текущим инструментом на изображении.
         """
-        if self.last_x and self.last_y:
-            self.canvas.create_line(self.last_x, self.last_y, event.x, event.y,
-                                    width=self.brush_size, fill=self.pen_color,
-                                    capstyle=tk.ROUND, smooth=tk.TRUE)
-            self.draw.line([self.last_x, self.last_y, event.x, event.y], fill=self.pen_color,
-                           width=self.brush_size)
+        if self.tool == 'Заливка':
+            return
+        if self.last_x is not None and self.last_y is not None:
+            bbox = self.apply_tool((self.last_x, self.last_y), (event.x, event.y), self.pen_rgb)
+            self.refresh(bbox)
+            logging.debug(f"Рисование линии: ({self.last_x}, {self.last_y}) -> ({event.x}, {event.y})")
 
         self.last_x = event.x
         self.last_y = event.y
-        logging.debug(f"Рисование линии: ({self.last_x}, {self.last_y}) -> ({event.x}, {event.y})")
 
     def reset(self, event):
         """
@@ -99,16 +167,19 @@ class DrawingApp:
         """
         Очищает холст и изображение.
         """
-        self.canvas.delete("all")
-        self.image = Image.new("RGB", (600, 400), "white")
-        self.draw = ImageDraw.Draw(self.image)
+        self.new_image()
         logging.info("Холст очищен.")
 
     def choose_color(self):
         """
         Открывает диалоговое окно выбора цвета.
         """
-        self.pen_color = colorchooser.askcolor(color=self.pen_color)[1]
+        color = colorchooser.askcolor(color=self.pen_color)[1]
+        # при отмене диалога askcolor возвращает None - оставляем прежний цвет
+        if color is None:
+            return
+        self.pen_color = color
+        self.pen_rgb = ImageColor.getrgb(color)
         logging.info(f"Выбран цвет: {self.pen_color}.")
 
     def save_image(self):
@@ -119,7 +190,7 @@ class DrawingApp:
         if file_path:
             if not file_path.endswith('.png'):
                 file_path += '.png'
-            self.image.save(file_path)
+            Image.fromarray(self.pixels).save(file_path)
             messagebox.showinfo("Информация", "Изображение успешно сохранено!")
             logging.info(f"Изображение сохранено в {file_path}.")
 
@@ -130,6 +201,13 @@ class DrawingApp:
         self.brush_size = int(value)
         logging.info(f"Размер кисти обновлен: {self.brush_size}.")
 
+    def update_tool(self, value):
+        """
+        Обновляет текущий инструмент.
+        """
+        self.tool = value
+        logging.info(f"Выбран инструмент: {self.tool}.")
+
 
 def main():
     root = tk.Tk()
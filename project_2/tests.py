@@ -0,0 +1,98 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+import tools
+
+
+def reference_fill(pixels, x, y):
+    """
+    Простая заливка обходом в ширину по четырём соседям.
+    Возвращает маску залитых пикселей.
+    """
+    height, width = pixels.shape[:2]
+    target = pixels[y, x].copy()
+    filled = np.zeros((height, width), dtype=bool)
+    queue = deque([(x, y)])
+    filled[y, x] = True
+    while queue:
+        cx, cy = queue.popleft()
+        for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+            if (0 <= nx < width and 0 <= ny < height and not filled[ny, nx]
+                    and np.array_equal(pixels[ny, nx], target)):
+                filled[ny, nx] = True
+                queue.append((nx, ny))
+    return filled
+
+
+class FloodFillTest(unittest.TestCase):
+    def test_matches_reference(self):
+        msg = "Заливка отличается от обхода в ширину"
+        rng = np.random.default_rng(0)
+        color = (255, 0, 0)
+        for _ in range(50):
+            height, width = rng.integers(1, 30, size=2)
+            pixels = np.full((height, width, 3), 255, dtype=np.uint8)
+            pixels[rng.random((height, width)) < 0.4] = 0
+            x, y = int(rng.integers(width)), int(rng.integers(height))
+            expected = reference_fill(pixels, x, y)
+            rows, columns = np.nonzero(expected)
+            expected_box = (columns.min(), rows.min(), columns.max() + 1, rows.max() + 1)
+
+            box = tools.flood_fill(pixels, x, y, color)
+            self.assertEqual(box, expected_box, msg)
+            np.testing.assert_array_equal((pixels == color).all(axis=2), expected, err_msg=msg)
+
+    def test_same_color_and_outside(self):
+        msg = "Заливка не должна ничего менять"
+        pixels = np.full((5, 5, 3), 255, dtype=np.uint8)
+        self.assertIsNone(tools.flood_fill(pixels, 2, 2, (255, 255, 255)), msg)
+        self.assertIsNone(tools.flood_fill(pixels, 5, 0, (0, 0, 0)), msg)
+
+
+class BrushTest(unittest.TestCase):
+    def setUp(self):
+        self.pixels = np.full((20, 30, 3), 255, dtype=np.uint8)
+
+    def test_stroke_bbox_clipped(self):
+        msg = "Область кисти выходит за границы холста"
+        box = tools.stroke(self.pixels, (-2, -2), (1, 1), 3, (0, 0, 0))
+        self.assertEqual(box, (0, 0, 5, 5), msg)
+        box = tools.stroke(self.pixels, (29, 19), (40, 25), 3, (0, 0, 0))
+        self.assertEqual(box, (26, 16, 30, 20), msg)
+        self.assertTrue((self.pixels[0, 0] == 0).all(), msg)
+        self.assertTrue((self.pixels[19, 29] == 0).all(), msg)
+
+    def test_stroke_off_canvas(self):
+        msg = "Кисть за холстом вернула область"
+        self.assertIsNone(tools.stroke(self.pixels, (-20, -20), (-10, -10), 3, (0, 0, 0)), msg)
+
+    def test_spray_off_canvas(self):
+        msg = "Спрей за холстом вернул область"
+        box = tools.spray(self.pixels, (100, 100), (120, 100), 5, (0, 0, 0),
+                          rng=np.random.default_rng(0))
+        self.assertIsNone(box, msg)
+        self.assertTrue((self.pixels == 255).all(), msg)
+
+    def test_spray_bbox_covers_points(self):
+        msg = "Область спрея не содержит всех точек"
+        box = tools.spray(self.pixels, (0, 0), (29, 19), 4, (0, 0, 0), density=0.5,
+                          rng=np.random.default_rng(0))
+        rows, columns = np.nonzero((self.pixels == 0).all(axis=2))
+        self.assertEqual(box, (columns.min(), rows.min(), columns.max() + 1, rows.max() + 1), msg)
+
+
+class PpmTest(unittest.TestCase):
+    def test_header_and_size(self):
+        msg = "Неверные данные PPM"
+        pixels = np.arange(20 * 30 * 3, dtype=np.uint32).astype(np.uint8).reshape(20, 30, 3)
+        data = tools.region_to_ppm(pixels, (5, 2, 12, 6))
+        header = b'P6 7 4 255\n'
+        self.assertTrue(data.startswith(header), msg)
+        self.assertEqual(len(data), len(header) + 7 * 4 * 3, msg)
+        self.assertEqual(data[len(header):], pixels[2:6, 5:12].tobytes(), msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+import numpy as np
+
+
+# Прямоугольник изменённой области задаётся как (x0, y0, x1, y1),
+# правая и нижняя границы не включаются (как box в PIL).
+
+
+def union_bbox(first, second):
+    """
+    Объединяет два прямоугольника изменённой области.
+
+    Args:
+        first (tuple | None): Первый прямоугольник.
+        second (tuple | None): Второй прямоугольник.
+
+    Returns:
+        tuple | None: Наименьший прямоугольник, содержащий оба.
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
+
+
+def _segment_bbox(pixels, p0, p1, radius):
+    """
+    Возвращает прямоугольник вокруг отрезка, расширенный на радиус
+    и обрезанный по границам изображения.
+    """
+    height, width = pixels.shape[:2]
+    x0 = max(int(np.floor(min(p0[0], p1[0]) - radius)), 0)
+    y0 = max(int(np.floor(min(p0[1], p1[1]) - radius)), 0)
+    x1 = min(int(np.ceil(max(p0[0], p1[0]) + radius)) + 1, width)
+    y1 = min(int(np.ceil(max(p0[1], p1[1]) + radius)) + 1, height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _distance_to_segment(bbox, p0, p1):
+    """
+    Считает расстояние от каждого пикселя прямоугольника до отрезка p0-p1.
+    """
+    x0, y0, x1, y1 = bbox
+    ys, xs = np.mgrid[y0:y1, x0:x1].astype(np.float32)
+    dx, dy = p1[0] - p0[0], p1[1] - p0[1]
+    length = dx * dx + dy * dy
+    if length == 0:
+        return np.hypot(xs - p0[0], ys - p0[1])
+    # проекция пикселя на отрезок, ограниченная его концами
+    t = np.clip(((xs - p0[0]) * dx + (ys - p0[1]) * dy) / length, 0, 1)
+    return np.hypot(xs - (p0[0] + t * dx), ys - (p0[1] + t * dy))
+
+
+def stroke(pixels, p0, p1, radius, color, hardness=1.0):
+    """
+    Рисует отрезок кистью заданного радиуса за один проход по области.
+
+    При hardness=1 кисть жёсткая, при меньших значениях край кисти
+    плавно смешивается с фоном.
+
+    Args:
+        pixels (np.ndarray): Массив пикселей (высота, ширина, 3), uint8.
+        p0 (tuple): Начальная точка (x, y).
+        p1 (tuple): Конечная точка (x, y).
+        radius (float): Радиус кисти.
+        color (tuple): Цвет (r, g, b).
+        hardness (float): Жёсткость кисти от 0 до 1.
+
+    Returns:
+        tuple | None: Изменённая область.
+    """
+    radius = max(radius, 0.5)
+    bbox = _segment_bbox(pixels, p0, p1, radius)
+    if bbox is None:
+        return None
+    x0, y0, x1, y1 = bbox
+    distance = _distance_to_segment(bbox, p0, p1)
+    region = pixels[y0:y1, x0:x1]
+    if hardness >= 1:
+        region[distance <= radius] = color
+        return bbox
+    # непрозрачность падает от 1 внутри твёрдого ядра до 0 на краю кисти
+    core = radius * hardness
+    alpha = np.clip((radius - distance) / (radius - core), 0, 1)[..., None]
+    blended = region * (1 - alpha) + np.asarray(color, dtype=np.float32) * alpha
+    region[...] = blended.round().astype(np.uint8)
+    return bbox
+
+
+def erase(pixels, p0, p1, radius, background=(255, 255, 255)):
+    """
+    Стирает отрезок, закрашивая его цветом фона.
+
+    Args:
+        pixels (np.ndarray): Массив пикселей.
+        p0 (tuple): Начальная точка (x, y).
+        p1 (tuple): Конечная точка (x, y).
+        radius (float): Радиус ластика.
+        background (tuple): Цвет фона (r, g, b).
+
+    Returns:
+        tuple | None: Изменённая область.
+    """
+    return stroke(pixels, p0, p1, radius, background)
+
+
+def spray(pixels, p0, p1, radius, color, density=0.05, rng=None):
+    """
+    Распыляет случайные точки вокруг отрезка.
+
+    Все точки генерируются и записываются одной векторной операцией.
+
+    Args:
+        pixels (np.ndarray): Массив пикселей.
+        p0 (tuple): Начальная точка (x, y).
+        p1 (tuple): Конечная точка (x, y).
+        radius (float): Радиус распыления.
+        color (tuple): Цвет (r, g, b).
+        density (float): Доля закрашиваемых пикселей круга за одно нажатие.
+        rng (np.random.Generator): Генератор случайных чисел.
+
+    Returns:
+        tuple | None: Изменённая область.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    height, width = pixels.shape[:2]
+    count = max(int(density * np.pi * radius * radius), 1)
+    # центры распыления равномерно распределены по отрезку
+    t = rng.random(count)
+    cx = p0[0] + t * (p1[0] - p0[0])
+    cy = p0[1] + t * (p1[1] - p0[1])
+    # sqrt даёт равномерное распределение точек по площади круга
+    r = radius * np.sqrt(rng.random(count))
+    angle = rng.random(count) * 2 * np.pi
+    xs = np.rint(cx + r * np.cos(angle)).astype(np.intp)
+    ys = np.rint(cy + r * np.sin(angle)).astype(np.intp)
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    xs, ys = xs[inside], ys[inside]
+    if xs.size == 0:
+        return None
+    pixels[ys, xs] = color
+    return int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1
+
+
+def flood_fill(pixels, x, y, color, tolerance=0):
+    """
+    Заливает связную область, начиная с точки (x, y).
+
+    Подходящие по цвету пиксели размечаются на связные компоненты
+    функцией scipy.ndimage.label, и закрашивается компонента начальной
+    точки. Время заливки не зависит от формы области.
+
+    Args:
+        pixels (np.ndarray): Массив пикселей.
+        x (int): Координата x начальной точки.
+        y (int): Координата y начальной точки.
+        color (tuple): Цвет заливки (r, g, b).
+        tolerance (int): Допустимое отличие канала от цвета начальной точки.
+
+    Returns:
+        tuple | None: Изменённая область.
+    """
+    # scipy нужен только заливке, поэтому без него остальные инструменты работают
+    from scipy import ndimage
+
+    height, width = pixels.shape[:2]
+    if not (0 <= x < width and 0 <= y < height):
+        return None
+    fill = np.asarray(color, dtype=np.uint8)
+    target = pixels[y, x].copy()
+    if tolerance == 0 and np.array_equal(target, fill):
+        return None
+
+    # mask - пиксели, подходящие по цвету начальной точки;
+    # границы считаются в uint8, без перевода всего изображения в int16
+    mask = np.ones((height, width), dtype=bool)
+    for channel in range(pixels.shape[2]):
+        values = pixels[..., channel]
+        low = max(int(target[channel]) - tolerance, 0)
+        high = min(int(target[channel]) + tolerance, 255)
+        if low == high:
+            mask &= values == low
+            continue
+        if low > 0:
+            mask &= values >= low
+        if high < 255:
+            mask &= values <= high
+
+    # связность по четырём соседям, как у построчной заливки
+    labels, _ = ndimage.label(mask)
+    filled = labels == labels[y, x]
+    rows = np.flatnonzero(filled.any(axis=1))
+    columns = np.flatnonzero(filled.any(axis=0))
+    x0, y0, x1, y1 = int(columns[0]), int(rows[0]), int(columns[-1]) + 1, int(rows[-1]) + 1
+    # copyto по каналам заметно быстрее присваивания по булевому индексу
+    region, filled = pixels[y0:y1, x0:x1], filled[y0:y1, x0:x1]
+    for channel in range(pixels.shape[2]):
+        np.copyto(region[..., channel], fill[channel], where=filled)
+    return x0, y0, x1, y1
+
+
+def region_to_ppm(pixels, bbox):
+    """
+    Кодирует область изображения в формат PPM для записи в tk.PhotoImage.
+
+    Args:
+        pixels (np.ndarray): Массив пикселей.
+        bbox (tuple): Область (x0, y0, x1, y1).
+
+    Returns:
+        bytes: Данные изображения в формате PPM.
+    """
+    x0, y0, x1, y1 = bbox
+    region = np.ascontiguousarray(pixels[y0:y1, x0:x1])
+    header = f'P6 {x1 - x0} {y1 - y0} 255\n'.encode('ascii')
+    return header + region.tobytes()